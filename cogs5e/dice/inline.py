@@ -29,7 +29,7 @@ class InlineRoller:
 
         # inline rolling feature flag
         if not await self.bot.ldclient.variation_for_discord_user(
-            "cog.dice.inline_rolling.enabled", user=message.author, default=False
+            "cog.dice.inline_rolling.enabled", message.author, False
         ):
             return
 
@@ -72,7 +72,7 @@ class InlineRoller:
 
         # inline rolling feature flag
         if not await self.bot.ldclient.variation_for_discord_user(
-            "cog.dice.inline_rolling.enabled", user=message.author, default=False
+            "cog.dice.inline_rolling.enabled", message.author, False
         ):
             return
 
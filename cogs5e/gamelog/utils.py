@@ -1,10 +1,17 @@
 import functools
 import logging
 
+import cachetools
+
 from ddb.gamelog import GameLogEventContext
 from ddb.gamelog.errors import IgnoreEvent
+from utils.config import EVAL_CACHE_ENABLED, EVAL_CACHE_TTL_MS
 import ldclient
 
+# game log events tend to arrive in bursts from the same user, so we hold on to flag evaluations for a few seconds
+# caches based on (flag name, ddb user id)
+_eval_cache = cachetools.TTLCache(maxsize=50_000, ttl=EVAL_CACHE_TTL_MS / 1000)
+
 
 def feature_flag(flag_name, default=False):
     """
@@ -18,6 +25,9 @@ def feature_flag(flag_name, default=False):
         ``Admin in user.roles`` will always return the global setting as we do not have the full user loaded yet
     """
 
+    # this only depends on the flag, so build it once here rather than on every event
+    disabled_msg = f"Feature flag {flag_name!r} is disabled for user %s"
+
     def decorator(inner):
         @functools.wraps(inner)
         async def wrapped(self, gctx: GameLogEventContext, *args, **kwargs):
@@ -29,10 +39,17 @@ def feature_flag(flag_name, default=False):
             user = gctx.event.user_id
 
             if not user:
-                raise IgnoreEvent(f"User {gctx.event.user_id} has not connected their account")
-            flag_on = await gctx.bot.ldclient.variation(flag_name, ldclient.Context.create(user), False)
+                raise IgnoreEvent("User %s has not connected their account", user)
+
+            cache_key = (flag_name, user)
+            flag_on = _eval_cache.get(cache_key) if EVAL_CACHE_ENABLED else None
+            if flag_on is None:
+                flag_on = gctx.bot.ldclient.variation_sync(flag_name, ldclient.Context.create(user), False)
+                if EVAL_CACHE_ENABLED:
+                    _eval_cache[cache_key] = flag_on
+
             if not flag_on:
-                raise IgnoreEvent(f"Feature flag {flag_name!r} is disabled for user {user}")
+                raise IgnoreEvent(disabled_msg, user)
             return await inner(self, gctx, *args, **kwargs)
 
         return wrapped
@@ -1,5 +1,6 @@
 import asyncio
 import faulthandler
+import gc
 import logging
 import random
 import sys
@@ -389,5 +390,7 @@ for cog in COGS:
 if __name__ == "__main__":
     faulthandler.enable()  # assumes we log errors to stderr, traces segfaults
     bot.state = "run"
+    # everything loaded by now (modules, cogs) lives as long as the process, so keep it out of gc collections
+    gc.freeze()
     bot.loop.create_task(compendium.reload_task(bot.mdb))
     bot.run(config.TOKEN)
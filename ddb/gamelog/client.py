@@ -163,7 +163,7 @@ class GameLogClient(BaseClient):
         try:
             await self._event_handlers[event.event_type](gctx)
         except IgnoreEvent as e:
-            log.debug(f"Event ID {event.id!r} was ignored: {e}")
+            log.debug("Event ID %r was ignored: %s", event.id, e)
             return
         except Exception as e:
             traceback.print_exc()
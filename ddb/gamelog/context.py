@@ -38,6 +38,7 @@ class GameLogEventContext:
         self._discord_user = _sentinel
         self._character = _sentinel
         self._destination_channel = _sentinel
+        self._ddb_user = _sentinel
 
     # ==== discord utils ====
     async def get_discord_user(self):
@@ -115,6 +116,19 @@ class GameLogEventContext:
                 raise
             log.info(f"Could not send message to channel {destination!r}: {e}")
 
+    # ==== ddb utils ====
+    async def get_ddb_user(self):
+        """
+        Gets the DDB user associated with the event. Returns None if the user has no DDB link.
+
+        :rtype: ddb.auth.BeyondUser or None
+        """
+        if self._ddb_user is not _sentinel:
+            return self._ddb_user
+
+        self._ddb_user = await self.bot.ddb.get_ddb_user(self, self.discord_user_id)
+        return self._ddb_user
+
     # ==== entity utils ====
     async def get_character(self):
         """
@@ -46,6 +46,18 @@ class CampaignAlreadyLinked(CampaignLinkException):
 
 # ==== event handling ====
 class IgnoreEvent(GameLogException):
-    """We should just stop processing this event. Do not display any error."""
+    """
+    We should just stop processing this event. Do not display any error.
 
-    pass
+    Like logging calls, the message may be a %-format string followed by its arguments - it is only formatted if
+    something actually reads it.
+    """
+
+    def __init__(self, msg, *args):
+        super().__init__(msg)
+        self.fmt_args = args
+
+    def __str__(self):
+        if self.fmt_args:
+            return self.args[0] % self.fmt_args
+        return super().__str__()
@@ -188,5 +188,8 @@ class MockAsyncLaunchDarklyClient:
     async def variation_for_ddb_user(self, key, user, default, *__, **___):
         return await self.variation(key, user, default)
 
+    def variation_sync(self, key, user, default):
+        return self.flag_store.get(key, default)
+
     def close(self):
         pass
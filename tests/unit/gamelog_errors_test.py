@@ -0,0 +1,34 @@
+from ddb.gamelog.errors import IgnoreEvent
+
+
+class CountingArg:
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+def test_ignore_event_formats_args():
+    assert str(IgnoreEvent("User %s has not connected their account", 1234)) == (
+        "User 1234 has not connected their account"
+    )
+    assert str(IgnoreEvent("Feature flag %r is disabled for user %s", "flag", 1234)) == (
+        "Feature flag 'flag' is disabled for user 1234"
+    )
+
+
+def test_ignore_event_without_args():
+    # without args, the message is used as is, even if it looks like a format string
+    assert str(IgnoreEvent("Character is not imported")) == "Character is not imported"
+    assert str(IgnoreEvent("100% done")) == "100% done"
+
+
+def test_ignore_event_formats_lazily():
+    arg = CountingArg()
+    exc = IgnoreEvent("User %s has not connected their account", arg)
+    assert arg.formatted == 0
+
+    assert str(exc) == "User arg has not connected their account"
+    assert arg.formatted == 1
@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+from ui import menu
+from ui.menu import MenuBase
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeResponse:
+    def __init__(self, interaction, done):
+        self.interaction = interaction
+        self.done = done
+
+    def is_done(self):
+        return self.done
+
+    async def edit_message(self, **kwargs):
+        self.done = True
+        self.interaction.calls.append(("edit_message", kwargs.get("content")))
+
+    async def defer(self):
+        self.done = True
+        self.interaction.calls.append(("defer", None))
+
+
+class FakeInteraction:
+    """Records the edits made through it. Edits to the original message take *edit_delay* seconds to land."""
+
+    def __init__(self, done=True, edit_delay=0):
+        self.response = FakeResponse(self, done)
+        self.edit_delay = edit_delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def edit_original_message(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.edit_delay)
+            self.calls.append(("edit_original_message", kwargs.get("content")))
+        finally:
+            self.in_flight -= 1
+
+
+class TextMenu(MenuBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.text = "a"
+
+    async def get_content(self):
+        return {"content": self.text}
+
+
+@pytest.fixture()
+def short_debounce(monkeypatch):
+    monkeypatch.setattr(menu, "REFRESH_DEBOUNCE_SECONDS", 0.01)
+
+
+async def test_unanswered_interaction_is_edited_immediately(short_debounce):
+    view = TextMenu(owner=None)
+    interaction = FakeInteraction(done=False)
+    await view.refresh_content(interaction)
+    assert interaction.calls == [("edit_message", "a")]
+
+
+async def test_followup_refreshes_are_coalesced(short_debounce):
+    view = TextMenu(owner=None)
+    interaction = FakeInteraction()
+    for text in "bcd":
+        view.text = text
+        await view.refresh_content(interaction)
+    assert interaction.calls == []
+
+    await asyncio.sleep(0.05)
+    assert interaction.calls == [("edit_original_message", "d")]
+
+
+async def test_followup_edits_do_not_overlap(short_debounce):
+    view = TextMenu(owner=None)
+    interaction = FakeInteraction(edit_delay=0.05)
+    view.text = "b"
+    await view.refresh_content(interaction)
+    await asyncio.sleep(0.03)  # the first edit is now in flight
+    assert interaction.in_flight == 1
+
+    view.text = "c"
+    await view.refresh_content(interaction)
+    await asyncio.sleep(0.15)
+    # an edit that has started is never cancelled, and later edits wait for it to land
+    assert interaction.calls == [("edit_original_message", "b"), ("edit_original_message", "c")]
+    assert interaction.max_in_flight == 1
+
+
+async def test_stop_cancels_pending_refresh(short_debounce):
+    view = TextMenu(owner=None)
+    interaction = FakeInteraction()
+    await view.refresh_content(interaction)
+    view.stop()
+
+    await asyncio.sleep(0.05)
+    assert interaction.calls == []
+
+
+async def test_render_errors_are_logged(short_debounce, caplog):
+    class BrokenMenu(MenuBase):
+        async def get_content(self):
+            raise ValueError("oops")
+
+    view = BrokenMenu(owner=None)
+    await view.refresh_content(FakeInteraction())
+
+    await asyncio.sleep(0.05)
+    assert "Could not render menu content" in caplog.text
+
+
+async def test_unchanged_content_is_not_edited(short_debounce):
+    view = TextMenu(owner=None)
+    first = FakeInteraction(done=False)
+    await view.refresh_content(first)
+    assert first.calls == [("edit_message", "a")]
+
+    # nothing changed, so the interaction is only acknowledged
+    second = FakeInteraction(done=False)
+    await view.refresh_content(second)
+    assert second.calls == [("defer", None)]
+
+    await view.refresh_content(second)
+    await asyncio.sleep(0.05)
+    assert second.calls == [("defer", None)]
+
+
+async def test_changed_content_is_edited(short_debounce):
+    view = TextMenu(owner=None)
+    await view.refresh_content(FakeInteraction(done=False))
+
+    view.text = "b"
+    interaction = FakeInteraction(done=False)
+    await view.refresh_content(interaction)
+    assert interaction.calls == [("edit_message", "b")]
+
+
+async def test_refresh_view_forces_next_edit(short_debounce):
+    view = TextMenu(owner=None)
+    await view.refresh_content(FakeInteraction(done=False))
+    await view.refresh_view(FakeInteraction())
+
+    interaction = FakeInteraction(done=False)
+    await view.refresh_content(interaction)
+    assert interaction.calls == [("edit_message", "a")]
+
+
+async def test_extra_kwargs_are_always_edited(short_debounce):
+    view = TextMenu(owner=None)
+    await view.refresh_content(FakeInteraction(done=False), file=object())
+
+    interaction = FakeInteraction(done=False)
+    await view.refresh_content(interaction, file=object())
+    assert interaction.calls == [("edit_message", "a")]
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from ui import servsettings
+from ui.servsettings import _SettingsUnitOfWork
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSettings:
+    """Stands in for ServerSettings, recording the state each commit wrote."""
+
+    guild_id = 1234
+
+    def __init__(self, commit_delay=0):
+        self.value = 0
+        self.commit_delay = commit_delay
+        self.fail_next = False
+        self.committed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def commit(self, mdb):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            value = self.value
+            await asyncio.sleep(self.commit_delay)
+            if self.fail_next:
+                self.fail_next = False
+                raise RuntimeError("db unavailable")
+            self.committed.append(value)
+        finally:
+            self.in_flight -= 1
+
+
+class FakeInteraction:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content, **kwargs):
+        self.sent.append((content, kwargs))
+
+
+@pytest.fixture()
+def short_debounce(monkeypatch):
+    monkeypatch.setattr(servsettings, "COMMIT_DEBOUNCE_SECONDS", 0.01)
+
+
+async def test_changes_in_quick_succession_are_coalesced(short_debounce):
+    settings = FakeSettings()
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    for i in range(1, 4):
+        settings.value = i
+        uow.mark_dirty()
+    assert settings.committed == []
+
+    await asyncio.sleep(0.05)
+    assert settings.committed == [3]
+
+
+async def test_flush_commits_now_and_cancels_pending(short_debounce):
+    settings = FakeSettings()
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    settings.value = 1
+    uow.mark_dirty()
+    await uow.flush()
+    assert settings.committed == [1]
+
+    # the debounced commit was cancelled, so nothing is written twice
+    await asyncio.sleep(0.05)
+    assert settings.committed == [1]
+
+
+async def test_flush_without_changes_does_nothing():
+    settings = FakeSettings()
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    await uow.flush()
+    assert settings.committed == []
+
+
+async def test_flush_waits_for_commit_in_progress(short_debounce):
+    settings = FakeSettings(commit_delay=0.05)
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    settings.value = 1
+    uow.mark_dirty()
+    await asyncio.sleep(0.03)  # the background commit is now in flight
+    assert settings.in_flight == 1
+
+    settings.value = 2
+    uow.mark_dirty()
+    await uow.flush()
+    # commits never overlap, and the newest state is written last
+    assert settings.committed == [1, 2]
+    assert settings.max_in_flight == 1
+
+
+async def test_failed_commit_stays_dirty():
+    settings = FakeSettings()
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    settings.value = 1
+    settings.fail_next = True
+    uow.mark_dirty()
+    with pytest.raises(RuntimeError):
+        await uow.flush()
+    assert settings.committed == []
+
+    await uow.flush()
+    assert settings.committed == [1]
+
+
+async def test_failed_background_commit_is_reported(short_debounce):
+    settings = FakeSettings()
+    uow = _SettingsUnitOfWork(settings, mdb=None)
+    uow.last_interaction = interaction = FakeInteraction()
+    settings.fail_next = True
+    uow.mark_dirty()
+
+    await asyncio.sleep(0.05)
+    assert settings.committed == []
+    assert len(interaction.sent) == 1
+    assert interaction.sent[0][1] == {"ephemeral": True}
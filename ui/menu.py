@@ -1,9 +1,42 @@
 import asyncio
 import contextlib
-from typing import Mapping, Optional, Type
+import hashlib
+import json
+import logging
+from typing import Callable, Mapping, Optional, Type
 
 import disnake
 
+# follow-up edits to a menu's message made within this many seconds of each other are coalesced into one
+REFRESH_DEBOUNCE_SECONDS = 0.075
+
+log = logging.getLogger(__name__)
+
+
+def _msg_from(author_id: int, channel_id: int):
+    """Returns a ``wait_for("message")`` check matching messages sent by the given user in the given channel."""
+    return lambda msg: msg.author.id == author_id and msg.channel.id == channel_id
+
+
+# deletes running in the background - the event loop only holds weak references to tasks, so we keep them alive here
+_pending_deletes = set()  # type: set[asyncio.Task]
+
+
+async def _safe_delete(message: disnake.Message):
+    try:
+        await message.delete()
+    except disnake.HTTPException:
+        pass
+    except Exception:
+        log.exception("Could not delete message")
+
+
+def _delete_soon(message: disnake.Message):
+    """Deletes the message in the background. HTTP errors are ignored, and anything else is logged."""
+    task = asyncio.create_task(_safe_delete(message))
+    _pending_deletes.add(task)
+    task.add_done_callback(_pending_deletes.discard)
+
 
 class MenuBase(disnake.ui.View):
     __menu_copy_attrs__ = ()
@@ -12,11 +45,16 @@ class MenuBase(disnake.ui.View):
         super().__init__(*args, **kwargs)
         self.owner = owner
         self.message = None  # type: Optional[disnake.Message]
+        self._pending_refresh = None  # type: Optional[asyncio.Task]
+        self._last_render_digest = None  # type: Optional[bytes]
+        # edits to the message are made one at a time, so that they land in the order they were made
+        self._edit_lock = asyncio.Lock()
 
     @classmethod
     def from_menu(cls, other: "MenuBase"):
         inst = cls(owner=other.owner)
         inst.message = other.message
+        inst._edit_lock = other._edit_lock  # the new menu edits the same message
         for attr in cls.__menu_copy_attrs__:
             # copy the instance attr to the new instance if available, or fall back to the class default
             sentinel = object()
@@ -74,28 +112,107 @@ class MenuBase(disnake.ui.View):
         await view.refresh_content(interaction)
 
     async def refresh_content(self, interaction: disnake.Interaction, **kwargs):
-        """Refresh the interaction's message with the current state of the menu."""
-        content_kwargs = await self.get_content()
+        """
+        Refresh the interaction's message with the current state of the menu.
+
+        If the interaction has already been responded to, the edit is made after a short delay, and is superseded by
+        any later refresh requested in the meantime, so that only the latest state is sent.
+        If nothing has changed since this menu last rendered the message, the edit is skipped.
+        """
+        self._cancel_pending_refresh()
         if interaction.response.is_done():
-            # using interaction feels cleaner, but we could probably do self.message.edit too
-            await interaction.edit_original_message(view=self, **content_kwargs, **kwargs)
-        else:
+            self._pending_refresh = asyncio.create_task(self._refresh_after_debounce(interaction, kwargs))
+            return
+
+        # the interaction has to be responded to now, so this can't wait
+        async with self._edit_lock:
+            content_kwargs = await self.get_content()
+            digest = self._render_digest(content_kwargs, kwargs)
+            if digest is not None and digest == self._last_render_digest:
+                await interaction.response.defer()
+                return
             await interaction.response.edit_message(view=self, **content_kwargs, **kwargs)
+            self._last_render_digest = digest
+
+    async def _refresh_after_debounce(self, interaction: disnake.Interaction, kwargs: dict):
+        try:
+            await asyncio.sleep(REFRESH_DEBOUNCE_SECONDS)
+            async with self._edit_lock:
+                # until now, a later refresh (or stop()) could supersede this one; from here on, the edit is made in
+                # full, and any later edit waits for it to land first
+                if self._pending_refresh is asyncio.current_task():
+                    self._pending_refresh = None
+                content_kwargs = await self.get_content()
+                digest = self._render_digest(content_kwargs, kwargs)
+                if digest is not None and digest == self._last_render_digest:
+                    return
+                # using interaction feels cleaner, but we could probably do self.message.edit too
+                await interaction.edit_original_message(view=self, **content_kwargs, **kwargs)
+                self._last_render_digest = digest
+        except disnake.HTTPException as e:
+            log.warning(f"Could not refresh menu content: {e}")
+        except Exception:
+            # nothing awaits this task, so anything raised here would otherwise go unreported
+            log.exception("Could not render menu content")
+
+    def _render_digest(self, content_kwargs: Mapping, kwargs: dict) -> Optional[bytes]:
+        """
+        Returns a digest of what a refresh with the given content would display, or None if it can't be compared
+        (e.g. it includes files).
+        """
+        if kwargs:
+            return None
+        payload = {
+            key: value.to_dict() if isinstance(value, disnake.Embed) else value for key, value in content_kwargs.items()
+        }
+        payload["components"] = self.to_components()
+        try:
+            serialized = json.dumps(payload, sort_keys=True)
+        except TypeError:
+            return None
+        return hashlib.blake2b(serialized.encode(), digest_size=16).digest()
+
+    def _cancel_pending_refresh(self):
+        if self._pending_refresh is not None:
+            self._pending_refresh.cancel()
+            self._pending_refresh = None
+
+    def stop(self):
+        # once stopped, this menu's message belongs to whatever menu (if any) replaced it
+        self._cancel_pending_refresh()
+        super().stop()
+
+    async def refresh_view(self, interaction: disnake.Interaction):
+        """
+        Refresh the interaction's message with the current state of the menu's components only, leaving its content
+        as it is. Use this instead of :meth:`refresh_content` when nothing but the components has changed.
+        """
+        self._last_render_digest = None
+        async with self._edit_lock:
+            if interaction.response.is_done():
+                await interaction.edit_original_message(view=self)
+            else:
+                await interaction.response.edit_message(view=self)
 
     @contextlib.asynccontextmanager
     async def disable_component(
-        self, interaction: disnake.Interaction, component: disnake.ui.Button | disnake.ui.Select
+        self,
+        interaction: disnake.Interaction,
+        component: disnake.ui.Button | disnake.ui.Select,
+        reenable: Optional[Callable[[], bool]] = None,
     ):
         """
         Updates the view such that the passed component is disabled while this context manager is active.
         Refreshes the view content after the context exits.
+
+        If *reenable* is passed, it is called on exit to decide whether the component should be enabled again.
         """
         component.disabled = True
-        await self.refresh_content(interaction)
+        await self.refresh_view(interaction)
         try:
             yield
         finally:
-            component.disabled = False
+            component.disabled = reenable is not None and not reenable()
             await self.refresh_content(interaction)
 
     @staticmethod
@@ -111,10 +228,10 @@ class MenuBase(disnake.ui.View):
             input_msg: disnake.Message = await interaction.bot.wait_for(
                 "message",
                 timeout=timeout,
-                check=lambda msg: msg.author == interaction.author and msg.channel.id == interaction.channel_id,
+                check=_msg_from(interaction.author.id, interaction.channel_id),
             )
-            with contextlib.suppress(disnake.HTTPException):
-                await input_msg.delete()
+            # the caller's response doesn't depend on the delete, so let them happen at the same time
+            _delete_soon(input_msg)
             return input_msg.content
         except asyncio.TimeoutError:
             return None
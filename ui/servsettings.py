@@ -1,14 +1,17 @@
 import abc
 import asyncio
+import dataclasses
+import functools
+import logging
 import re
-from contextlib import suppress
-from typing import List, Optional, TYPE_CHECKING, TypeVar
+from typing import Callable, List, Optional, TYPE_CHECKING, Tuple, TypeVar
 
 import d20
 import disnake
 
 from utils.constants import STAT_ABBREVIATIONS
 from utils.enums import CritDamageType
+from utils.feature_flags import discord_user_to_context
 from utils.functions import natural_join
 from utils.settings.guild import InlineRollingType, LegacyPreference, RandcharRule, ServerSettings
 from .menu import MenuBase
@@ -20,22 +23,198 @@ if TYPE_CHECKING:
     _AvraeT = Avrae
 
 TOO_MANY_ROLES_SENTINEL = "__special:too_many_roles"
+COMMIT_DEBOUNCE_SECONDS = 0.25
+MAX_LISTED_RULES = 5  # over/under rules are summarized in the roll stats menu if there are more than this
+# over/under rules, e.g. "1>15" or "2 < 10"
+_RULE_RE = re.compile(r"\s*(\d+)\s*([<>])\s*(\d+)\s*")
+_RULE_TYPE_WORDS = {"gt": "over", "lt": "under"}
+# role mentions in a message's content, e.g. "<@&1234>"
+_ROLE_MENTION_RE = re.compile(r"<@&(\d+)>")
+# Remove Rule option values - Add Rule stops at 25 rules, the most options a select can hold
+_RULE_INDEX_STRS = tuple(str(i) for i in range(25))
+_DEFAULT_STAT_NAMES_DESC = ", ".join(stat.upper() for stat in STAT_ABBREVIATIONS)
+
+# static descriptions of the custom stat roll settings
+_DICE_DESC = "\n*This is the dice string that will be rolled six times for each stat set.*"
+_SETS_DESC = "\n*This is how many sets of stat rolls it will return, allowing your players to choose between them.*"
+_NUM_DESC = "\n*This is how many stat rolls it will return per set, allowing your players to choose between them.*"
+_STRAIGHT_DESC = "\n*If this is enabled, stats will automatically be assigned to stats in the order they are rolled.*"
+_MIN_DESC = "\n*This is the minimum combined score required. Standard array is 72 total.*"
+_MAX_DESC = "\n*This is the maximum combined score required. Standard array is 72 total.*"
+_RULES_DESC = (
+    "\n*This is a list of how many of the stats you require to be over/under a certain value, such as having at "
+    "least one stat over 17, or two stats under 10.*"
+)
+
+_BLURPLE = disnake.Colour.blurple().value
+
+log = logging.getLogger(__name__)
+
+
+class _SettingsUnitOfWork:
+    """
+    Tracks unsaved changes to a guild's settings and writes them back in as few commits as possible.
+    One is shared by every menu in a settings session, so changes made across sub-menus are batched together.
+    """
+
+    def __init__(self, settings: ServerSettings, mdb):
+        self.settings = settings
+        self.mdb = mdb
+        self._dirty = False
+        self._pending = None  # type: Optional[asyncio.Task]
+        self._lock = asyncio.Lock()
+        # the latest interaction with any menu in the session, used to tell the user about commits that fail
+        self.last_interaction = None  # type: Optional[disnake.Interaction]
+
+    def mark_dirty(self):
+        """
+        Records that the settings have changed and schedules a commit. Changes made in quick succession (e.g. clicking
+        through several toggles or removing several rules) are coalesced into a single write.
+        """
+        self._dirty = True
+        if self._pending is None:
+            self._pending = asyncio.create_task(self._flush_after_debounce())
+
+    async def _flush_after_debounce(self):
+        await asyncio.sleep(COMMIT_DEBOUNCE_SECONDS)
+        self._pending = None
+        await self.flush_or_report()
+
+    async def flush(self):
+        """
+        Commits the settings to the db now, if they have changed. Commits never overlap, so this waits for any commit
+        already in progress and returns once every change made before it was called has been written.
+        """
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        async with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                await self.settings.commit(self.mdb)
+            except Exception:
+                # the menus already show the changes, so keep them pending for the next flush rather than losing them
+                self._dirty = True
+                raise
+
+    async def flush_or_report(self):
+        """
+        Like :meth:`flush`, but if the commit fails, logs the error and tells the user through their latest interaction
+        instead of raising.
+        """
+        try:
+            await self.flush()
+        except Exception as e:
+            log.warning(f"Could not commit server settings for guild {self.settings.guild_id}: {e}")
+            if self.last_interaction is None:
+                return
+            try:
+                await self.last_interaction.send(
+                    "Your server settings could not be saved. Please try changing them again in a moment.",
+                    ephemeral=True,
+                )
+            except disnake.HTTPException:
+                pass
 
 
 class ServerSettingsMenuBase(MenuBase, abc.ABC):
-    __menu_copy_attrs__ = ("bot", "settings", "guild")
+    __menu_copy_attrs__ = ("bot", "settings", "guild", "uow", "_flag_cache")
     bot: _AvraeT
     settings: ServerSettings
     guild: disnake.Guild
+    uow: _SettingsUnitOfWork
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._flag_cache = {}  # shared between all menus in the session, see __menu_copy_attrs__
+        self._dm_roles_str_cache = None  # type: Optional[tuple[tuple[int, ...], str]]
+        self._embed = None  # type: Optional[disnake.Embed]
+        self._embed_fields = []  # type: List[Tuple[str, str, bool]]
 
     async def commit_settings(self):
-        """Commits any changed guild settings to the db."""
-        await self.settings.commit(self.bot.mdb)
+        """
+        Schedules a commit of the changed guild settings to the db (see :meth:`_SettingsUnitOfWork.mark_dirty`).
+        Use :meth:`flush_settings` to write immediately.
+        """
+        self.uow.mark_dirty()
+
+    async def flush_settings(self):
+        """
+        Commits any changed guild settings to the db now, if there are any.
+        If the commit fails, the user is told about it rather than the error being raised.
+        """
+        await self.uow.flush_or_report()
+
+    async def interaction_check(self, interaction: disnake.Interaction) -> bool:
+        if not await super().interaction_check(interaction):
+            return False
+        self.uow.last_interaction = interaction
+        return True
+
+    # make sure nothing is left unwritten when we move to another menu or stop
+    async def defer_to(self, view_type, interaction: disnake.Interaction, stop=True):
+        # the new menu renders from the in-memory settings, so respond to the interaction before writing to the db
+        await super().defer_to(view_type, interaction, stop)
+        await self.flush_settings()
+
+    async def on_timeout(self):
+        await self.flush_settings()
+        await super().on_timeout()
+
+    @functools.cached_property
+    def _ld_context(self):
+        """The LaunchDarkly context for the menu's owner, who does not change for the lifetime of the menu."""
+        return discord_user_to_context(self.owner)
+
+    async def _flag(self, key: str) -> bool:
+        """Returns the value of a feature flag for the menu's owner, evaluated at most once per menu session."""
+        if key not in self._flag_cache:
+            self._flag_cache[key] = await self.bot.ldclient.variation(key, self._ld_context, False)
+        return self._flag_cache[key]
+
+    def _dm_roles_mention_str(self) -> str:
+        """Returns the configured DM roles as a list of role mentions, rebuilding it only when the roles change."""
+        key = tuple(self.settings.dm_roles or ())
+        if self._dm_roles_str_cache is None or self._dm_roles_str_cache[0] != key:
+            self._dm_roles_str_cache = (key, natural_join([f"<@&{role_id}>" for role_id in key], "or"))
+        return self._dm_roles_str_cache[1]
+
+    def _build_embed(
+        self, title: str, fields: List[Tuple[str, str, bool]], description: Optional[str] = None
+    ) -> disnake.Embed:
+        """
+        Returns this menu's embed with the given title, description, and (name, value, inline) fields.
+        The embed from the previous render is reused, and only the fields that changed are updated.
+        """
+        embed = self._embed
+        if (
+            embed is None
+            or embed.title != title
+            or embed.description != description
+            or len(embed.fields) != len(fields)
+        ):
+            embed_data = {
+                "type": "rich",
+                "title": title,
+                "color": _BLURPLE,
+                "fields": [{"name": name, "value": value, "inline": inline} for name, value, inline in fields],
+            }
+            if description is not None:
+                embed_data["description"] = description
+            embed = disnake.Embed.from_dict(embed_data)
+        else:
+            for i, (old_field, field) in enumerate(zip(self._embed_fields, fields)):
+                if field != old_field:
+                    name, value, inline = field
+                    embed.set_field_at(i, name=name, value=value, inline=inline)
+        self._embed = embed
+        self._embed_fields = fields
+        return embed
 
     async def get_inline_rolling_desc(self) -> str:
-        flag_enabled = await self.bot.ldclient.variation_for_discord_user(
-            "cog.dice.inline_rolling.enabled", user=self.owner, default=False
-        )
+        flag_enabled = await self._flag("cog.dice.inline_rolling.enabled")
         if not flag_enabled:
             return "Inline rolling is currently **globally disabled** for all users. Check back soon!"
 
@@ -56,6 +235,7 @@ class ServerSettingsUI(ServerSettingsMenuBase):
         inst.bot = bot
         inst.settings = settings
         inst.guild = guild
+        inst.uow = _SettingsUnitOfWork(settings, bot.mdb)
         return inst
 
     @disnake.ui.button(label="Lookup Settings", style=disnake.ButtonStyle.primary)
@@ -79,54 +259,52 @@ class ServerSettingsUI(ServerSettingsMenuBase):
         await self.on_timeout()
 
     async def get_content(self):
-        embed = disnake.Embed(title=f"Server Settings for {self.guild.name}", colour=disnake.Colour.blurple())
         if self.settings.dm_roles:
-            dm_roles = natural_join([f"<@&{role_id}>" for role_id in self.settings.dm_roles], "or")
+            dm_roles = self._dm_roles_mention_str()
         else:
             dm_roles = "Dungeon Master, DM, Game Master, or GM"
-        embed.add_field(
-            name="__Lookup Settings__",
-            value=(
-                f"**DM Roles**: {dm_roles}\n"
-                f"**Monsters Require DM**: {self.settings.lookup_dm_required}\n"
-                f"**Direct Message DM**: {self.settings.lookup_pm_dm}\n"
-                f"**Direct Message Results**: {self.settings.lookup_pm_result}\n"
-                f"**Prefer Legacy Content**: {legacy_preference_desc(self.settings.legacy_preference)}"
-            ),
-            inline=False,
-        )
-        embed.add_field(name="Inline Rolling Settings", value=await self.get_inline_rolling_desc(), inline=False)
-
-        embed.add_field(
-            name="__Custom Stat Roll Settings__",
-            value=(
-                f"**Dice**: {self.settings.randchar_dice}\n"
-                f"**Number of Sets**: {self.settings.randchar_sets}\n"
-                f"**Assign Stats**: {self.settings.randchar_straight}\n"
-                f"**Stat Names:** {stat_names_desc(self.settings.randchar_stat_names)}\n"
-                f"**Minimum Total**: {self.settings.randchar_min}\n"
-                f"**Maximum Total**: {self.settings.randchar_max}\n"
-                f"**Over/Under Rules**: {get_over_under_desc(self.settings.randchar_rules)}"
-            ),
-            inline=False,
-        )
 
-        nlp_enabled_description = ""
-        nlp_feature_flag = await self.bot.ldclient.variation_for_discord_user(
-            "cog.initiative.upenn_nlp.enabled", user=self.owner, default=False
+        # these each wait on a separate feature flag on the first render, so evaluate them together
+        inline_rolling_desc, nlp_feature_flag = await asyncio.gather(
+            self.get_inline_rolling_desc(), self._flag("cog.initiative.upenn_nlp.enabled")
         )
+        nlp_enabled_description = ""
         if nlp_feature_flag:
             nlp_enabled_description = f"\n**Contribute Message Data to NLP Training**: {self.settings.upenn_nlp_opt_in}"
-        embed.add_field(
-            name="__Miscellaneous Settings__",
-            value=(
-                f"**Show DDB Campaign Message**: {self.settings.show_campaign_cta}\n"
-                f"**Critical Damage Type**: {crit_type_desc(self.settings.crit_type)}"
-                f"{nlp_enabled_description}"
-            ),
-            inline=False,
-        )
 
+        embed = self._build_embed(
+            title=f"Server Settings for {self.guild.name}",
+            fields=[
+                (
+                    "__Lookup Settings__",
+                    f"**DM Roles**: {dm_roles}\n"
+                    f"**Monsters Require DM**: {self.settings.lookup_dm_required}\n"
+                    f"**Direct Message DM**: {self.settings.lookup_pm_dm}\n"
+                    f"**Direct Message Results**: {self.settings.lookup_pm_result}\n"
+                    f"**Prefer Legacy Content**: {legacy_preference_desc(self.settings.legacy_preference)}",
+                    False,
+                ),
+                ("Inline Rolling Settings", inline_rolling_desc, False),
+                (
+                    "__Custom Stat Roll Settings__",
+                    f"**Dice**: {self.settings.randchar_dice}\n"
+                    f"**Number of Sets**: {self.settings.randchar_sets}\n"
+                    f"**Assign Stats**: {self.settings.randchar_straight}\n"
+                    f"**Stat Names:** {stat_names_desc(self.settings.randchar_stat_names)}\n"
+                    f"**Minimum Total**: {self.settings.randchar_min}\n"
+                    f"**Maximum Total**: {self.settings.randchar_max}\n"
+                    f"**Over/Under Rules**: {get_over_under_desc(self.settings.randchar_rules)}",
+                    False,
+                ),
+                (
+                    "__Miscellaneous Settings__",
+                    f"**Show DDB Campaign Message**: {self.settings.show_campaign_cta}\n"
+                    f"**Critical Damage Type**: {crit_type_desc(self.settings.crit_type)}"
+                    f"{nlp_enabled_description}",
+                    False,
+                ),
+            ],
+        )
         return {"embed": embed}
 
 
@@ -139,6 +317,7 @@ _LEGACY_PREFERENCE_SELECT_OPTIONS = [
 
 class _LookupSettingsUI(ServerSettingsMenuBase):
     select_dm_roles: disnake.ui.Select  # make the type checker happy
+    _dm_role_options_key: Optional[tuple] = None  # the guild roles the DM role options were last built from
 
     # ==== ui ====
     @disnake.ui.select(placeholder="Select DM Roles", min_values=0)
@@ -183,36 +362,35 @@ class _LookupSettingsUI(ServerSettingsMenuBase):
     # ==== handlers ====
     async def _text_select_dm_roles(self, interaction: disnake.Interaction) -> Optional[List[int]]:
         self.select_dm_roles.disabled = True
-        await self.refresh_content(interaction)
-        await interaction.send(
-            (
-                "Choose the DM roles by sending a message to this channel. You can mention the roles, or use a "
-                "comma-separated list of role names or IDs. Type `reset` to reset the role list to the default."
-            ),
-            ephemeral=True,
-        )
-
+        await self.refresh_view(interaction)
         try:
-            input_msg: disnake.Message = await self.bot.wait_for(
-                "message",
-                timeout=60,
-                check=lambda msg: msg.author == interaction.author and msg.channel.id == interaction.channel_id,
+            reply = await self.prompt_message(
+                interaction,
+                (
+                    "Choose the DM roles by sending a message to this channel. You can mention the roles, or use a "
+                    "comma-separated list of role names or IDs. Type `reset` to reset the role list to the default."
+                ),
             )
-            with suppress(disnake.HTTPException):
-                await input_msg.delete()
+            if reply is None:
+                await interaction.send("No valid roles found. Use the select menu to try again.", ephemeral=True)
+                return self.settings.dm_roles
 
-            if input_msg.content == "reset":
+            if reply == "reset":
                 await interaction.send("The DM roles have been updated.", ephemeral=True)
                 return None
 
-            role_ids = {r.id for r in input_msg.role_mentions}
-            for stmt in input_msg.content.split(","):
+            role_ids = {
+                role_id for role_id in map(int, _ROLE_MENTION_RE.findall(reply)) if self.guild.get_role(role_id)
+            }
+            # reversed so that if two roles share a name, the lowest one wins, like a linear search would
+            roles_by_name = {r.name.lower(): r for r in reversed(self.guild.roles)}
+            for stmt in reply.split(","):
                 clean_stmt = stmt.strip()
                 try:  # get role by id
                     role_id = int(clean_stmt)
                     maybe_role = self.guild.get_role(role_id)
                 except ValueError:  # get role by name
-                    maybe_role = next((r for r in self.guild.roles if r.name.lower() == clean_stmt.lower()), None)
+                    maybe_role = roles_by_name.get(clean_stmt.lower())
                 if maybe_role is not None:
                     role_ids.add(maybe_role.id)
 
@@ -221,94 +399,94 @@ class _LookupSettingsUI(ServerSettingsMenuBase):
                 return list(role_ids)
             await interaction.send("No valid roles found. Use the select menu to try again.", ephemeral=True)
             return self.settings.dm_roles
-        except asyncio.TimeoutError:
-            await interaction.send("No valid roles found. Use the select menu to try again.", ephemeral=True)
-            return self.settings.dm_roles
         finally:
             self.select_dm_roles.disabled = False
 
     # ==== content ====
     def _refresh_dm_role_select(self):
         """Update the options in the DM Role select to reflect the currently selected values."""
-        self.select_dm_roles.options.clear()
-        if len(self.guild.roles) > 25:
+        roles = self.guild.roles
+        if len(roles) > 25:
+            self._dm_role_options_key = None
+            self.select_dm_roles.options.clear()
             self.select_dm_roles.add_option(
                 label="Whoa, this server has a lot of roles! Click here to select them.", value=TOO_MANY_ROLES_SENTINEL
             )
             return
 
-        for role in reversed(self.guild.roles):  # display highest-first
-            selected = self.settings.dm_roles is not None and role.id in self.settings.dm_roles
-            self.select_dm_roles.add_option(label=role.name, value=str(role.id), emoji=role.emoji, default=selected)
-        self.select_dm_roles.max_values = len(self.select_dm_roles.options)
+        selected_ids = frozenset(self.settings.dm_roles or ())
+        roles_key = tuple((role.id, role.name) for role in roles)
+        if roles_key == self._dm_role_options_key:
+            # the guild's roles haven't changed since we built the options, so we only need to update the selection
+            for option in self.select_dm_roles.options:
+                option.default = int(option.value) in selected_ids
+            return
+
+        self._dm_role_options_key = roles_key
+        options = [
+            disnake.SelectOption(label=role.name, value=str(role.id), emoji=role.emoji, default=role.id in selected_ids)
+            for role in reversed(roles)  # display highest-first
+        ]
+        self.select_dm_roles.options = options
+        self.select_dm_roles.max_values = len(options)
 
     async def _before_send(self):
         self._refresh_dm_role_select()
 
     async def get_content(self):
-        embed = disnake.Embed(
-            title=f"Server Settings ({self.guild.name}) / Lookup Settings",
-            colour=disnake.Colour.blurple(),
-            description="These settings affect how lookup results are displayed on this server.",
-        )
         if not self.settings.dm_roles:
-            embed.add_field(
-                name="DM Roles",
-                value=(
-                    f"**Dungeon Master, DM, Game Master, or GM**\n"
-                    f"*Any user with a role named one of these will be considered a DM. This lets them look up a "
-                    f"monster's full stat block if `Monsters Require DM` is enabled, skip other players' turns in "
-                    f"initiative, and more.*"
-                ),
-                inline=False,
+            dm_roles_field = (
+                "DM Roles",
+                "**Dungeon Master, DM, Game Master, or GM**\n"
+                "*Any user with a role named one of these will be considered a DM. This lets them look up a "
+                "monster's full stat block if `Monsters Require DM` is enabled, skip other players' turns in "
+                "initiative, and more.*",
+                False,
             )
         else:
-            dm_roles = natural_join([f"<@&{role_id}>" for role_id in self.settings.dm_roles], "or")
-            embed.add_field(
-                name="DM Roles",
-                value=(
-                    f"**{dm_roles}**\n"
-                    "*Any user with at least one of these roles will be considered a DM. This lets them look up a "
-                    "monster's full stat block if `Monsters Require DM` is enabled, skip turns in initiative, and "
-                    "more.*"
-                ),
-                inline=False,
+            dm_roles_field = (
+                "DM Roles",
+                f"**{self._dm_roles_mention_str()}**\n"
+                "*Any user with at least one of these roles will be considered a DM. This lets them look up a "
+                "monster's full stat block if `Monsters Require DM` is enabled, skip turns in initiative, and "
+                "more.*",
+                False,
             )
-        embed.add_field(
-            name="Monsters Require DM",
-            value=(
-                f"**{self.settings.lookup_dm_required}**\n"
-                "*If this is enabled, monster lookups will display hidden stats for any user without "
-                "a role named DM, GM, Dungeon Master, Game Master, or the DM role configured above.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Direct Message DMs",
-            value=(
-                f"**{self.settings.lookup_pm_dm}**\n"
-                "*If this is enabled, the result of monster lookups will be direct messaged to the user who looked "
-                "it up, rather than being printed to the channel, if the user is a DM.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Direct Message Results",
-            value=(
-                f"**{self.settings.lookup_pm_result}**\n"
-                "*If this is enabled, the result of all lookups will be direct messaged to the user who looked "
-                "it up, rather than being printed to the channel.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Prefer Legacy Content",
-            value=(
-                f"**{legacy_preference_desc(self.settings.legacy_preference)}**\n"
-                "*If the only two options found in a content search are a legacy and non-legacy version of the same "
-                "thing, whether to prefer the latest version, the legacy version, or always ask the user to select "
-                "between the two.*"
-            ),
+        embed = self._build_embed(
+            title=f"Server Settings ({self.guild.name}) / Lookup Settings",
+            description="These settings affect how lookup results are displayed on this server.",
+            fields=[
+                dm_roles_field,
+                (
+                    "Monsters Require DM",
+                    f"**{self.settings.lookup_dm_required}**\n"
+                    "*If this is enabled, monster lookups will display hidden stats for any user without "
+                    "a role named DM, GM, Dungeon Master, Game Master, or the DM role configured above.*",
+                    False,
+                ),
+                (
+                    "Direct Message DMs",
+                    f"**{self.settings.lookup_pm_dm}**\n"
+                    "*If this is enabled, the result of monster lookups will be direct messaged to the user who looked "
+                    "it up, rather than being printed to the channel, if the user is a DM.*",
+                    False,
+                ),
+                (
+                    "Direct Message Results",
+                    f"**{self.settings.lookup_pm_result}**\n"
+                    "*If this is enabled, the result of all lookups will be direct messaged to the user who looked "
+                    "it up, rather than being printed to the channel.*",
+                    False,
+                ),
+                (
+                    "Prefer Legacy Content",
+                    f"**{legacy_preference_desc(self.settings.legacy_preference)}**\n"
+                    "*If the only two options found in a content search are a legacy and non-legacy version of the "
+                    "same thing, whether to prefer the latest version, the legacy version, or always ask the user to "
+                    "select between the two.*",
+                    True,
+                ),
+            ],
         )
         return {"embed": embed}
 
@@ -401,29 +579,21 @@ class _MiscellaneousSettingsUI(ServerSettingsMenuBase):
             self.toggle_upenn_nlp_opt_in: disnake.ui.Button
 
         # nlp feature flag
-        flag_enabled = await self.bot.ldclient.variation_for_discord_user(
-            "cog.initiative.upenn_nlp.enabled", user=self.owner, default=False
-        )
+        flag_enabled = await self._flag("cog.initiative.upenn_nlp.enabled")
         if not flag_enabled:
             self.remove_item(self.toggle_upenn_nlp_opt_in)
 
     async def get_content(self):
-        embed = disnake.Embed(
-            title=f"Server Settings ({self.guild.name}) / Miscellaneous Settings",
-            colour=disnake.Colour.blurple(),
-        )
-        embed.add_field(
-            name="Show DDB Campaign Message",
-            value=(
+        fields = [
+            (
+                "Show DDB Campaign Message",
                 f"**{self.settings.show_campaign_cta}**\n"
                 "*If this is enabled, you will receive occasional reminders to link your D&D Beyond campaign when "
-                "you import a character in an unlinked campaign.*"
+                "you import a character in an unlinked campaign.*",
+                False,
             ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Crit Damage Type",
-            value=(
+            (
+                "Crit Damage Type",
                 f"**{crit_type_desc(self.settings.crit_type)}**\n"
                 "_This affects how critical damage is treated on the server._\n"
                 " ● Add Max Dice Value\n"
@@ -433,230 +603,231 @@ class _MiscellaneousSettingsUI(ServerSettingsMenuBase):
                 " ● Double Dice Total\n"
                 "> _This type doubles the total value of the dice rolled._\n> `2d8 + 4` -> `(2d8) * 2 + 4`\n"
                 " ● Double Total\n"
-                "> _This type doubles the total, including modifiers._\n> `2d8 + 4` -> `(2d8 + 4) * 2`"
+                "> _This type doubles the total, including modifiers._\n> `2d8 + 4` -> `(2d8 + 4) * 2`",
+                False,
             ),
-            inline=False,
-        )
+        ]
 
-        nlp_feature_flag = await self.bot.ldclient.variation_for_discord_user(
-            "cog.initiative.upenn_nlp.enabled", user=self.owner, default=False
-        )
+        nlp_feature_flag = await self._flag("cog.initiative.upenn_nlp.enabled")
         if nlp_feature_flag:
-            embed.add_field(
-                name="Contribute Message Data to Natural Language AI Training",
-                value=(
-                    f"**{self.settings.upenn_nlp_opt_in}**\n*If this is enabled, the contents of messages, displayed"
-                    " nicknames, character names, and snapshots of a character's sheet will be recorded in channels"
-                    " **with an active combat.***\n*This data will be used in a project to make advances in"
-                    " interactive fiction and text generation using artificial intelligence at the University of"
-                    " Pennsylvania.*\n*Read more about the project"
-                    " [here](https://www.cis.upenn.edu/~ccb/language-to-avrae.html), and our data handling and Privacy"
-                    " Policy [here](https://company.wizards.com/en/legal/wizards-coasts-privacy-policy).*"
-                ),
-                inline=False,
-            )
-
+            fields.append((
+                "Contribute Message Data to Natural Language AI Training",
+                f"**{self.settings.upenn_nlp_opt_in}**\n*If this is enabled, the contents of messages, displayed"
+                " nicknames, character names, and snapshots of a character's sheet will be recorded in channels"
+                " **with an active combat.***\n*This data will be used in a project to make advances in"
+                " interactive fiction and text generation using artificial intelligence at the University of"
+                " Pennsylvania.*\n*Read more about the project"
+                " [here](https://www.cis.upenn.edu/~ccb/language-to-avrae.html), and our data handling and Privacy"
+                " Policy [here](https://company.wizards.com/en/legal/wizards-coasts-privacy-policy).*",
+                False,
+            ))
+
+        embed = self._build_embed(title=f"Server Settings ({self.guild.name}) / Miscellaneous Settings", fields=fields)
         return {"embed": embed}
 
 
+class _InvalidReply(Exception):
+    """Raised by a prompt parser to reject the user's reply. The message, if any, is shown to the user."""
+
+
 class _RollStatsSettingsUI(ServerSettingsMenuBase):
+    _rule_options_key: Optional[tuple] = None  # the rules the Remove Rule options were last built from
+    # the settings the content was last rendered from, and that content
+    _content_cache: Tuple[Optional["_RollStatsSnapshot"], Optional[dict]] = (None, None)
+
+    async def _prompt_user(
+        self,
+        button: disnake.ui.Button,
+        interaction: disnake.Interaction,
+        prompt: str,
+        parser: Callable[[str], Optional[str]],
+        success_msg: str,
+        fail_msg: str,
+        reenable: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """
+        Prompts the user for a value with the given button disabled, then passes their reply to *parser*, which should
+        apply it to the settings or raise :exc:`_InvalidReply` to reject it. Commits the settings on success.
+        The parser may return a notice about a side effect, which is sent before *success_msg*.
+        Returns whether the settings were updated.
+
+        *reenable* is passed on to :meth:`disable_component`.
+        """
+        async with self.disable_component(interaction, button, reenable):
+            reply = await self.prompt_message(interaction, prompt)
+            try:
+                if reply is None:
+                    raise _InvalidReply()
+                notice = parser(reply)
+            except _InvalidReply as e:
+                await interaction.send(f"{str(e) or fail_msg} Press `{button.label}` to try again.", ephemeral=True)
+                return False
+            if notice is not None:
+                await interaction.send(notice, ephemeral=True)
+            await self.commit_settings()
+            await interaction.send(success_msg, ephemeral=True)
+            return True
+
     # ==== ui ====
     @disnake.ui.button(label="Set Dice", style=disnake.ButtonStyle.primary)
     async def select_dice(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_dice = await self.prompt_message(
-                interaction,
-                (
-                    "Choose a new dice string to roll by sending a message in this channel. If you wish to "
-                    "use the default dice (4d6kh3), respond with 'default'."
-                ),
-            )
-            if randchar_dice is None:
-                await interaction.send(f"No valid dice found. Press `{button.label}` to try again.", ephemeral=True)
-                return
-            if randchar_dice.lower() == "default":
-                randchar_dice = "4d6kh3"
+        def parser(reply: str):
+            randchar_dice = "4d6kh3" if reply.lower() == "default" else reply
             try:
                 d20.parse(randchar_dice)
             except d20.errors.RollSyntaxError:
-                await interaction.send(f"Invalid dice string. Press `{button.label}` to try again.", ephemeral=True)
-                return
-
+                raise _InvalidReply("Invalid dice string.")
             self.settings.randchar_dice = randchar_dice
-            await self.commit_settings()
-            await interaction.send("Your dice have been updated.", ephemeral=True)
+
+        await self._prompt_user(
+            button,
+            interaction,
+            (
+                "Choose a new dice string to roll by sending a message in this channel. If you wish to "
+                "use the default dice (4d6kh3), respond with 'default'."
+            ),
+            parser,
+            success_msg="Your dice have been updated.",
+            fail_msg="No valid dice found.",
+        )
 
     @disnake.ui.button(label="Set Number of Sets", style=disnake.ButtonStyle.primary)
     async def select_sets(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_sets = await self.prompt_message(
-                interaction, "Choose a new number of sets to roll by sending a message in this channel."
-            )
-            if randchar_sets is None:
-                await interaction.send(
-                    f"No valid number of sets found. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            if not (randchar_sets.isdigit() and 1 <= int(randchar_sets) <= 25):
-                await interaction.send(
-                    f"Number of sets not between 1 and 25. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            self.settings.randchar_sets = int(randchar_sets)
-            await self.commit_settings()
-            await interaction.send("Your number of sets have been updated.", ephemeral=True)
+        def parser(reply: str):
+            value = int(reply) if reply.isdigit() else 0
+            if not 1 <= value <= 25:
+                raise _InvalidReply("Number of sets not between 1 and 25.")
+            self.settings.randchar_sets = value
+
+        await self._prompt_user(
+            button,
+            interaction,
+            "Choose a new number of sets to roll by sending a message in this channel.",
+            parser,
+            success_msg="Your number of sets have been updated.",
+            fail_msg="No valid number of sets found.",
+        )
 
     @disnake.ui.button(label="Set Number of Stats", style=disnake.ButtonStyle.primary)
     async def select_stats(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_stats = await self.prompt_message(
-                interaction, "Choose a new number of stats to roll by sending a message in this channel."
-            )
-            if randchar_stats is None:
-                await interaction.send(
-                    f"No valid number of stats found. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            if not (randchar_stats.isdigit() and 1 <= int(randchar_stats) <= 10):
-                await interaction.send(
-                    f"Number of stats not between 1 and 10. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            self.settings.randchar_num = int(randchar_stats)
+        def parser(reply: str):
+            value = int(reply) if reply.isdigit() else 0
+            if not 1 <= value <= 10:
+                raise _InvalidReply("Number of stats not between 1 and 10.")
+            self.settings.randchar_num = value
             if self.settings.randchar_num != len(self.settings.randchar_stat_names) and self.settings.randchar_straight:
                 self.settings.randchar_straight = False
-                await interaction.send(
-                    "Disabled `Assign Stats` due to the number of stat names not matching the number of stats.",
-                    ephemeral=True,
-                )
-            await self.commit_settings()
-            await interaction.send("Your number of stats have been updated.", ephemeral=True)
+                return "Disabled `Assign Stats` due to the number of stat names not matching the number of stats."
+
+        await self._prompt_user(
+            button,
+            interaction,
+            "Choose a new number of stats to roll by sending a message in this channel.",
+            parser,
+            success_msg="Your number of stats have been updated.",
+            fail_msg="No valid number of stats found.",
+        )
 
     @disnake.ui.button(label="Toggle Assign Stats", style=disnake.ButtonStyle.primary)
     async def toggle_straight(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        self.settings.randchar_straight = not self.settings.randchar_straight
         if self.settings.randchar_straight:
-            async with self.disable_component(interaction, button):
-                randchar_stat_names = await self.prompt_message(
-                    interaction,
-                    (
-                        "Choose the stat names to automatically assign the rolled stats to, separated by commas.\nIf"
-                        " you wish to use the default stats, respond with 'default'. This will only work if your number"
-                        " of stats is 6."
-                    ),
-                )
-                if randchar_stat_names is None:
-                    await interaction.send(
-                        f"No valid stat names found. Press `{button.label}` to try again.", ephemeral=True
-                    )
-                    self.settings.randchar_straight = False
-                    await self.commit_settings()
-                    await self.refresh_content(interaction)
-                    return
-                if randchar_stat_names.lower() == "default":
-                    stat_names = [stat.upper() for stat in STAT_ABBREVIATIONS]
-                else:
-                    stat_names = randchar_stat_names.replace(", ", ",").split(",")
-                if len(stat_names) != self.settings.randchar_num:
-                    await interaction.send(
-                        (
-                            f"Number of stat names does not match the number of stats. Press `{button.label}` to try"
-                            " again."
-                        ),
-                        ephemeral=True,
-                    )
-                    self.settings.randchar_straight = False
-                    await self.commit_settings()
-                    await self.refresh_content(interaction)
-                    return
-                self.settings.randchar_stat_names = stat_names
-                await self.commit_settings()
-                await interaction.send("Your stat names have been updated.", ephemeral=True)
-        else:
+            self.settings.randchar_straight = False
             await self.commit_settings()
             await self.refresh_content(interaction)
+            return
+
+        def parser(reply: str):
+            if reply.lower() == "default":
+                stat_names = [stat.upper() for stat in STAT_ABBREVIATIONS]
+            else:
+                stat_names = reply.replace(", ", ",").split(",")
+            if len(stat_names) != self.settings.randchar_num:
+                raise _InvalidReply("Number of stat names does not match the number of stats.")
+            self.settings.randchar_stat_names = stat_names
+            # only turned on once we have valid stat names, so a failed prompt leaves nothing to commit or undo
+            self.settings.randchar_straight = True
+
+        await self._prompt_user(
+            button,
+            interaction,
+            (
+                "Choose the stat names to automatically assign the rolled stats to, separated by commas.\nIf"
+                " you wish to use the default stats, respond with 'default'. This will only work if your number"
+                " of stats is 6."
+            ),
+            parser,
+            success_msg="Your stat names have been updated.",
+            fail_msg="No valid stat names found.",
+        )
+
+    @staticmethod
+    def _parse_score_limit(reply: str) -> Optional[int]:
+        """Parses a minimum/maximum roll total, where 'reset' removes the limit."""
+        if reply.lower() == "reset":
+            return None
+        if not reply.isdigit():
+            raise _InvalidReply()
+        return int(reply)
 
     @disnake.ui.button(label="Set Minimum", style=disnake.ButtonStyle.primary, row=1)
     async def select_minimum(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_min = await self.prompt_message(
-                interaction,
-                (
-                    "Choose a new minimum roll total by sending a message in this channel. "
-                    "To reset it, respond with 'reset'."
-                ),
-            )
-            if randchar_min is None:
-                await interaction.send(f"No valid minimum found. Press `{button.label}` to try again.", ephemeral=True)
-                return
-            if randchar_min.lower() == "reset":
-                self.settings.randchar_min = None
-            elif not randchar_min.isdigit():
-                await interaction.send(f"No valid minimum found. Press `{button.label}` to try again.", ephemeral=True)
-                return
-            else:
-                self.settings.randchar_min = int(randchar_min)
-            await self.commit_settings()
-            await interaction.send("Your minimum score has been updated.", ephemeral=True)
+        def parser(reply: str):
+            self.settings.randchar_min = self._parse_score_limit(reply)
+
+        await self._prompt_user(
+            button,
+            interaction,
+            (
+                "Choose a new minimum roll total by sending a message in this channel. "
+                "To reset it, respond with 'reset'."
+            ),
+            parser,
+            success_msg="Your minimum score has been updated.",
+            fail_msg="No valid minimum found.",
+        )
 
     @disnake.ui.button(label="Set Maximum", style=disnake.ButtonStyle.primary, row=1)
     async def select_maximum(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_max = await self.prompt_message(
-                interaction,
-                (
-                    "Choose a new maximum roll total by sending a message in this channel. "
-                    "To reset it, respond with 'reset'."
-                ),
-            )
-            if randchar_max is None:
-                await interaction.send(f"No valid maximum found. Press `{button.label}` to try again.", ephemeral=True)
-                return
-            if randchar_max.lower() == "reset":
-                self.settings.randchar_max = None
-            elif not randchar_max.isdigit():
-                await interaction.send(f"No valid maximum found. Press `{button.label}` to try again.", ephemeral=True)
-                return
-            else:
-                self.settings.randchar_max = int(randchar_max)
-            await self.commit_settings()
-            await interaction.send("Your maximum score has been updated.", ephemeral=True)
+        def parser(reply: str):
+            self.settings.randchar_max = self._parse_score_limit(reply)
+
+        await self._prompt_user(
+            button,
+            interaction,
+            (
+                "Choose a new maximum roll total by sending a message in this channel. "
+                "To reset it, respond with 'reset'."
+            ),
+            parser,
+            success_msg="Your maximum score has been updated.",
+            fail_msg="No valid maximum found.",
+        )
 
     @disnake.ui.button(label="Add Over/Under Rule", style=disnake.ButtonStyle.primary, row=1)
     async def add_rule(self, button: disnake.ui.Button, interaction: disnake.Interaction):
-        async with self.disable_component(interaction, button):
-            randchar_rule = await self.prompt_message(
-                interaction,
-                (
-                    'Add a new score rule by sending a message in this channel.\nPlease use the format "number>score"'
-                    ' or "number<score", for example "1>15" for at least one over 15, or "2<10" for at least two'
-                    " under 10."
-                ),
-            )
-            if randchar_rule is None:
-                await interaction.send(
-                    f"No valid over/under found. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            rule_match = re.fullmatch(r"(\d+)(>|<)(\d+)", randchar_rule)
+        def parser(reply: str):
+            rule_match = _RULE_RE.fullmatch(reply)
             if rule_match is None:
-                await interaction.send(
-                    f"No valid over/under rule found. Press `{button.label}` to try again.", ephemeral=True
-                )
-                return
-            match rule_match.groups():
-                case [amount, "<", value]:
-                    new_rule = RandcharRule(type="lt", amount=amount, value=value)
-                case [amount, ">", value]:
-                    new_rule = RandcharRule(type="gt", amount=amount, value=value)
+                raise _InvalidReply("No valid over/under rule found.")
+            amount, op, value = rule_match.groups()
+            new_rule = RandcharRule(type="gt" if op == ">" else "lt", amount=int(amount), value=int(value))
             self.settings.randchar_rules.append(new_rule)
             self._refresh_remove_rule_select()
-            await self.commit_settings()
-            await interaction.send("Your required over/under rules has been updated.", ephemeral=True)
-        # Disable button if we have >= 25 rules, so we don't overfill the select
-        if len(self.settings.randchar_rules) >= 25:
-            button.disabled = True
-            await self.refresh_content(interaction)
+
+        await self._prompt_user(
+            button,
+            interaction,
+            (
+                'Add a new score rule by sending a message in this channel.\nPlease use the format "number>score"'
+                ' or "number<score", for example "1>15" for at least one over 15, or "2<10" for at least two'
+                " under 10."
+            ),
+            parser,
+            success_msg="Your required over/under rules has been updated.",
+            fail_msg="No valid over/under found.",
+            # Leave button disabled if we have >= 25 rules, so we don't overfill the select
+            reenable=lambda: len(self.settings.randchar_rules) < 25,
+        )
 
     @disnake.ui.select(placeholder="Remove Rule", min_values=0, max_values=1, row=3)
     async def remove_rule(self, select: disnake.ui.Select, interaction: disnake.Interaction):
@@ -673,106 +844,119 @@ class _RollStatsSettingsUI(ServerSettingsMenuBase):
     # ==== content ====
     def _refresh_remove_rule_select(self):
         """Update the options in the Remove Rule select to reflect the currently available values."""
-        self.remove_rule.options.clear()
-        if not self.settings.randchar_rules:
-            self.remove_rule.add_option(label="Empty")
+        rules_key = _rules_key(self.settings.randchar_rules)
+        if rules_key == self._rule_options_key:
+            return
+        self._rule_options_key = rules_key
+        if not rules_key:
+            self.remove_rule.options = [disnake.SelectOption(label="Empty")]
             self.remove_rule.disabled = True
             return
         self.remove_rule.disabled = False
-        if len(self.settings.randchar_rules) < 25:
+        if len(rules_key) < 25:
             self.add_rule.disabled = False
         else:
             self.add_rule.disabled = True
-        for i, rule in enumerate(self.settings.randchar_rules):
-            self.remove_rule.add_option(
-                label=f"{rule.amount} {'over' if rule.type == 'gt' else 'under'} {rule.value}", value=str(i)
-            )
+        self.remove_rule.options = [
+            disnake.SelectOption(label=_rule_label(*rule), value=_RULE_INDEX_STRS[i])
+            for i, rule in enumerate(rules_key)
+        ]
 
     async def _before_send(self):
         self._refresh_remove_rule_select()
 
     async def get_content(self):
-        embed = disnake.Embed(
-            title=f"Server Settings ({self.guild.name}) / Custom Stat Roll Settings",
-            colour=disnake.Colour.blurple(),
-        )
-        embed.add_field(
-            name="Dice Rolled",
-            value=(
-                f"**{self.settings.randchar_dice}**\n"
-                "*This is the dice string that will be rolled six times for "
-                "each stat set.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Number of Sets",
-            value=(
-                f"**{self.settings.randchar_sets}**\n"
-                "*This is how many sets of stat rolls it will return, "
-                "allowing your players to choose between them.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Number of Stats",
-            value=(
-                f"**{self.settings.randchar_num}**\n"
-                "*This is how many stat rolls it will return per set, "
-                "allowing your players to choose between them.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Assign Stats Directly",
-            value=(
-                f"**{self.settings.randchar_straight}**\n"
-                f"**Stat Names:** {stat_names_desc(self.settings.randchar_stat_names)}\n"
-                "*If this is enabled, stats will automatically be assigned to stats in the order "
-                "they are rolled.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Minimum Total Score Required",
-            value=(
-                f"**{self.settings.randchar_min}**\n"
-                "*This is the minimum combined score required. Standard array is 72 total.*"
-            ),
-            inline=False,
-        )
-        embed.add_field(
-            name="Maximum Total Score Required",
-            value=(
-                f"**{self.settings.randchar_max}**\n"
-                "*This is the maximum combined score required. Standard array is 72 total.*"
-            ),
-            inline=False,
+        snapshot = _RollStatsSnapshot.from_settings(self.guild.name, self.settings)
+        if snapshot == self._content_cache[0]:
+            return self._content_cache[1]
+
+        if len(snapshot.rules) <= MAX_LISTED_RULES:
+            rules_desc = _over_under_desc(snapshot.rules)
+        else:
+            # the Remove Rule select lists them all anyway
+            rules_desc = f"{len(snapshot.rules)} rules - open the Remove Rule menu to view them"
+
+        embed = self._build_embed(
+            title=f"Server Settings ({snapshot.guild_name}) / Custom Stat Roll Settings",
+            fields=[
+                ("Dice Rolled", f"**{snapshot.dice}**{_DICE_DESC}", False),
+                ("Number of Sets", f"**{snapshot.sets}**{_SETS_DESC}", False),
+                ("Number of Stats", f"**{snapshot.num}**{_NUM_DESC}", False),
+                (
+                    "Assign Stats Directly",
+                    f"**{snapshot.straight}**\n**Stat Names:** {stat_names_desc(snapshot.stat_names)}{_STRAIGHT_DESC}",
+                    False,
+                ),
+                ("Minimum Total Score Required", f"**{snapshot.min}**{_MIN_DESC}", False),
+                ("Maximum Total Score Required", f"**{snapshot.max}**{_MAX_DESC}", False),
+                ("Over/Under Rules", f"**{rules_desc}**{_RULES_DESC}", False),
+            ],
         )
-        embed.add_field(
-            name="Over/Under Rules",
-            value=(
-                f"**{get_over_under_desc(self.settings.randchar_rules)}**\n"
-                "*This is a list of how many of the stats you require to be over/under a certain value, "
-                "such as having at least one stat over 17, or two stats under 10.*"
-            ),
-            inline=False,
+        self._content_cache = (snapshot, {"embed": embed})
+        return self._content_cache[1]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _RollStatsSnapshot:
+    """
+    The custom stat roll settings as rendered by the roll stats menu, read once from the settings model.
+    Comparing two snapshots tells whether the menu's content needs to be rebuilt.
+    """
+
+    guild_name: str
+    dice: str
+    sets: int
+    num: int
+    straight: bool
+    stat_names: Tuple[str, ...]
+    min: Optional[int]
+    max: Optional[int]
+    rules: Tuple[Tuple[str, int, int], ...]  # (type, amount, value)
+
+    @classmethod
+    def from_settings(cls, guild_name: str, settings: ServerSettings) -> "_RollStatsSnapshot":
+        return cls(
+            guild_name=guild_name,
+            dice=settings.randchar_dice,
+            sets=settings.randchar_sets,
+            num=settings.randchar_num,
+            straight=settings.randchar_straight,
+            stat_names=tuple(settings.randchar_stat_names or ()),
+            min=settings.randchar_min,
+            max=settings.randchar_max,
+            rules=_rules_key(settings.randchar_rules),
         )
 
-        return {"embed": embed}
+
+def _rules_key(rules: List[RandcharRule]) -> Tuple[Tuple[str, int, int], ...]:
+    return tuple((rule.type, rule.amount, rule.value) for rule in rules)
 
 
 def get_over_under_desc(rules) -> str:
+    return _over_under_desc(_rules_key(rules or ()))
+
+
+@functools.lru_cache(maxsize=256)
+def _over_under_desc(rules: Tuple[Tuple[str, int, int], ...]) -> str:
     if not rules:
         return "None"
-    out = []
-    for rule in rules:
-        out.append(f"{rule.amount} {'over' if rule.type == 'gt' else 'under'} {rule.value}")
-    return f"At least {', '.join(out)}"
+    return f"At least {', '.join(_rule_label(*rule) for rule in rules)}"
+
+
+@functools.lru_cache(maxsize=256)
+def _rule_label(rule_type: str, amount: int, value: int) -> str:
+    return f"{amount} {_RULE_TYPE_WORDS[rule_type]} {value}"
 
 
 def stat_names_desc(stat_names: list) -> str:
-    return ", ".join(stat_names or [stat.upper() for stat in STAT_ABBREVIATIONS])
+    if not stat_names:
+        return _DEFAULT_STAT_NAMES_DESC
+    return _stat_names_desc(tuple(stat_names))
+
+
+@functools.lru_cache(maxsize=256)
+def _stat_names_desc(stat_names: Tuple[str, ...]) -> str:
+    return ", ".join(stat_names)
 
 
 def crit_type_desc(mode: CritDamageType) -> str:
@@ -53,11 +53,9 @@ def feature_flag(flag_name, use_ddb_user=False, default=False):
     async def predicate(ctx):
         if use_ddb_user:
             ddb_user = await ctx.bot.ddb.get_ddb_user(ctx, ctx.author.id)
-            flag_on = await ctx.bot.ldclient.variation_for_ddb_user(
-                flag_name, user=ddb_user, default=default, discord_id=ctx.author.id
-            )
+            flag_on = await ctx.bot.ldclient.variation_for_ddb_user(flag_name, ddb_user, default, ctx.author.id)
         else:
-            flag_on = await ctx.bot.ldclient.variation_for_discord_user(flag_name, user=ctx.author, default=default)
+            flag_on = await ctx.bot.ldclient.variation_for_discord_user(flag_name, ctx.author, default)
 
         if flag_on:
             return True
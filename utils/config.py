@@ -74,6 +74,9 @@ DDB_MEDIA_S3_BUCKET_DOMAIN = os.getenv("DDB_MEDIA_S3_BUCKET_DOMAIN", "www.dndbey
 
 # ---- launchdarkly ----
 LAUNCHDARKLY_SDK_KEY = os.getenv("LAUNCHDARKLY_SDK_KEY")
+# short-lived in-process cache of game log flag evaluations - disable if a flag needs to roll out instantly
+EVAL_CACHE_ENABLED = os.getenv("EVAL_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+EVAL_CACHE_TTL_MS = int(os.getenv("EVAL_CACHE_TTL_MS", 3000))
 
 # ---- discord bot list ----
 DBL_TOKEN = os.getenv("DBL_TOKEN")  # optional
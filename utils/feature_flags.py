@@ -1,5 +1,10 @@
 """
-Asyncio wrapper for launchdarkly client to ensure flag evaluation is not a blocking call.
+Asyncio wrapper for launchdarkly client.
+
+The async methods run flag evaluation in a separate thread so that it never blocks the event loop. The *_sync methods
+evaluate on the calling thread instead: with the SDK's default streaming data source and in-memory store, evaluation is
+only a lookup against the locally held ruleset, so they are fine on hot paths where the thread hop would cost more than
+the evaluation itself. Don't use them with a data source or store that can block, such as a persistent feature store.
 """
 
 from typing import Optional, TYPE_CHECKING
@@ -24,6 +29,16 @@ class AsyncLaunchDarklyClient(ldclient.LDClient):
     async def variation(self, key, user, default):  # run variation evaluation in a separate thread
         return await self.loop.run_in_executor(None, super().variation, key, user, default)
 
+    def variation_sync(self, key, user, default):
+        """
+        Evaluates a flag in-process, without handing it off to a separate thread.
+
+        We use the SDK's default streaming data source and in-memory store, so evaluation is only a lookup against the
+        locally held ruleset and never waits on the network. Prefer this on hot paths where the thread hop costs more
+        than the evaluation itself.
+        """
+        return super().variation(key, user, default)
+
     async def variation_for_discord_user(self, key: str, user: "disnake.User", default):
         """
         Returns a variation for a given key based on a Discord user.